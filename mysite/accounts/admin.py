@@ -1,9 +1,18 @@
+from functools import lru_cache
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
+from django.db.models import Prefetch, prefetch_related_objects
 from django.urls import reverse
-from django.utils.html import format_html
+from django.utils.html import format_html_join
+from django.utils.safestring import mark_safe
 from .models import CustomUser, Department
 
+# Resolve the user change URL once and reuse it as a template for every user link
+@lru_cache(maxsize=1)
+def customuser_change_url_template():
+    return reverse("super_admin:accounts_customuser_change", args=[0]).replace("/0/", "/{}/")
+
+
 # Admin configuration for CustomUser model
 class CustomUserAdmin(UserAdmin):
     model = CustomUser
@@ -13,6 +22,7 @@ class CustomUserAdmin(UserAdmin):
         }),
     )
     list_display = ("last_name", "first_name", "email", "role", "department")
+    list_select_related = ("department",)  # Join the department instead of loading it per row
     list_filter = ("role", "department")
     search_fields = ("username", "email", "role")
     ordering = ("last_name",)
@@ -43,39 +53,38 @@ class DepartmentAdmin(admin.ModelAdmin):
     ordering = ("name",)
     readonly_fields = ("view_executives_or_heads", "view_department_employees")
 
+    # Prefetch the department's users once so the readonly callables filter in memory.
+    # Only the change view needs them, the changelist lists just the name
+    def get_object(self, request, object_id, from_field=None):
+        obj = super().get_object(request, object_id, from_field)
+        if obj is not None:
+            prefetch_related_objects([obj], Prefetch(
+                "users",
+                queryset=CustomUser.objects.only("id", "first_name", "last_name", "role", "department"),
+                to_attr="prefetched_users",
+            ))
+        return obj
+
+    # Render the department's users with the given role as change-page links, one per line
+    def _user_links(self, obj, role):
+        # Bind loop invariants to locals before walking the users
+        format_url = customuser_change_url_template().format
+        link_rows = [
+            (format_url(user.id), user.first_name, user.last_name)
+            for user in obj.prefetched_users if user.role == role
+        ]
+        return format_html_join(mark_safe("<br>"), '<a href="{}">{} {}</a>', link_rows) or "None"
+
     def view_executives_or_heads(self, obj):
         if obj.name.lower() == "executive":
             # Display executives for the Executive Department
-            executives = obj.users.filter(role=CustomUser.EXECUTIVE)
-            if executives.exists():
-                # Create a clickable link for each executive
-                return format_html("<br>".join([
-                    f'<a href="{reverse("super_admin:accounts_customuser_change", args=[user.id])}">'
-                    f"{user.first_name} {user.last_name}</a>"
-                    for user in executives
-                ]))
-            return "None"
-        else:
-            # Display department heads for other departments
-            heads = obj.users.filter(role=CustomUser.DEPARTMENT_HEAD)
-            if heads.exists():
-                # Create a clickable link for each dept head
-                return format_html("<br>".join([
-                    f'<a href="{reverse("super_admin:accounts_customuser_change", args=[user.id])}">'
-                    f"{user.first_name} {user.last_name}</a>"
-                    for user in heads
-                ]))
-            return "None"
+            return self._user_links(obj, CustomUser.EXECUTIVE)
+        # Display department heads for other departments
+        return self._user_links(obj, CustomUser.DEPARTMENT_HEAD)
 
     def view_department_employees(self, obj):
-        employees = obj.users.filter(role=CustomUser.EMPLOYEE)
-        if employees.exists():
-            # Create a clickable link for each employee
-            return format_html("<br>".join([
-                f'<a href="{reverse("super_admin:accounts_customuser_change", args=[user.id])}">{user.first_name} {user.last_name}</a>'
-                for user in employees
-            ]))
-        return "None"
+        # Create a clickable link for each employee
+        return self._user_links(obj, CustomUser.EMPLOYEE)
 
     view_executives_or_heads.short_description = "Executives / Department Heads"
     view_department_employees.short_description = "Employees"
@@ -45,6 +45,10 @@ class CustomUserCreationForm(UserCreationForm):
     class Meta:
         model = CustomUser
         fields = ['first_name', 'last_name' ,'username', 'email', 'password1', 'password2']
+        # Email is unique on the model, so the form's unique check reports duplicates
+        error_messages = {
+            'email': {'unique': "This email is already in use."},
+        }
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -71,12 +75,6 @@ class CustomUserCreationForm(UserCreationForm):
             'id': 'floatingPassword2'
         })
 
-    def clean_email(self):
-        email = self.cleaned_data.get('email')
-        if CustomUser.objects.filter(email=email).exists():
-            raise forms.ValidationError("This email is already in use.")
-        return email
-
     def save(self, commit=True):
         user = super().save(commit=False)
         user.role = CustomUser.EMPLOYEE  # Default role
@@ -1,14 +1,19 @@
-from django.shortcuts import redirect
+from django.conf import settings
+from django.shortcuts import redirect, resolve_url
 from django.urls import reverse
+from .views import ROLE_TO_URL
 
 # Redirect users to the appropriate page based on their role
 class RoleRedirectMiddleware:
     def __init__(self, get_response):
         self.get_response = get_response
 
-    def __call__(self, request):
+        # Resolve portal URLs once, the URLconf does not change at runtime
+        self.super_admin_url = reverse('super_admin:index')
+        self.role_urls = {role: resolve_url(target) for role, target in ROLE_TO_URL.items()}
+
         # Skip middleware logic for logout and account-related URLs
-        exempt_paths = [
+        self.exempt_paths = frozenset([
             '/accounts/logout/',
             reverse('password_change'),
             reverse('password_change_done'),
@@ -16,20 +21,27 @@ class RoleRedirectMiddleware:
             reverse('password_reset_done'),
             reverse('password_reset_confirm', kwargs={'uidb64': 'uidb64', 'token': 'token'}),
             reverse('password_reset_complete'),
-        ]
+        ])
+        # The handbook and static files never redirect
+        self.exempt_prefixes = ('/handbook/', settings.STATIC_URL)
+
+    def __call__(self, request):
+        # Cheap path checks first
+        path = request.path
+        if path in self.exempt_paths or path.startswith(self.exempt_prefixes):
+            return self.get_response(request)
 
-        if request.path in exempt_paths or request.path.startswith('/handbook/'):
+        # Anonymous users have no role to redirect on
+        user = request.user
+        if not user.is_authenticated:
             return self.get_response(request)
 
-        if request.user.is_authenticated:
-            # Redirect based on role
-            if request.user.is_superuser and not request.path.startswith(reverse('super_admin:index')):
-                return redirect('super_admin:index')
-            elif request.user.is_executive() and not request.path.startswith(reverse('executive_admin:index')):
-                return redirect('executive_admin:index')
-            elif request.user.is_department_head() and not request.path.startswith(reverse('department_head_admin:index')):
-                return redirect('department_head_admin:index')
-            elif request.user.is_employee() and not request.path.startswith('/handbook/'):
-                return redirect('/handbook/')
+        # Redirect based on role, superusers always belong to the super admin portal
+        if user.is_superuser:
+            target = self.super_admin_url
+        else:
+            target = self.role_urls.get(user.role)
+        if target and not path.startswith(target):
+            return redirect(target)
 
         return self.get_response(request)
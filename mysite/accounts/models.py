@@ -5,6 +5,25 @@ from handbook.models import Policy, ProcedureStep, Definition, PolicyApprovalReq
 from django.contrib.auth.models import AbstractUser
 from django.db import models
 
+# Permission codenames granted to each elevated role
+ROLE_PERMISSION_CODENAMES = {
+    'department_head': ['view_procedurestep', 'view_policy', 'view_definition', 'view_policyapprovalrequest'],
+    'executive': ['view_procedurestep', 'view_policy', 'view_definition', 'view_policyapprovalrequest'],
+}
+
+# Look up the permission IDs granted to a role. Not remembered between calls, since permission
+# rows are recreated when the database is flushed or migrated again
+def permission_ids_for_role(role):
+    return list(Permission.objects.filter(
+        content_type__in=[
+            ContentType.objects.get_for_model(Policy),
+            ContentType.objects.get_for_model(Definition),
+            ContentType.objects.get_for_model(ProcedureStep),
+        ],
+        codename__in=ROLE_PERMISSION_CODENAMES[role],
+    ).values_list('id', flat=True))
+
+
 class Department(models.Model):
     name = models.CharField(max_length=100, unique=True)
 
@@ -12,6 +31,13 @@ class Department(models.Model):
         return self.name
 
 
+# Get (or create) the Executive department and return its ID. Looked up on every call, since a
+# remembered ID could outlive a department deleted in another process or a rolled back create
+def get_executive_department_id():
+    executive_department, _ = Department.objects.only('id').get_or_create(name="Executive")
+    return executive_department.pk
+
+
 class CustomUser(AbstractUser):
     # Additional Required fields
     email = models.EmailField(unique=True)
@@ -40,6 +66,17 @@ class CustomUser(AbstractUser):
         related_name="users"
     )
 
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            models.Index(fields=['department', 'role'], name='user_dept_role_idx'),  # Department users by role
+            models.Index(fields=['role'], name='user_role_idx'),  # Admin role filter
+        ]
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Remember the loaded role so saves can tell whether permissions need updating
+        self._original_role = self.__dict__.get('role')
+
     def is_employee(self):
         return self.role == self.EMPLOYEE
 
@@ -54,23 +91,27 @@ class CustomUser(AbstractUser):
 
     # Validates the role and department assignments before saving.
     def clean(self):
+        # Only executives and department heads have department rules to check
+        if self.role not in (self.EXECUTIVE, self.DEPARTMENT_HEAD):
+            return super().clean()
+
         # Get or create the Executive department
-        executive_department, _ = Department.objects.get_or_create(name="Executive")
+        executive_department_id = get_executive_department_id()
 
         # Validation for executives
         if self.is_executive():
             # Ensure the executive is only in the Executive department
-            if self.department and self.department != executive_department:
+            if self.department_id and self.department_id != executive_department_id:
                 raise ValidationError({"department": "Executives must belong to the Executive department."})
-            self.department = executive_department
+            self.department_id = executive_department_id
 
         # Validation for department heads
         if self.is_department_head():
             # Department heads cannot belong to the Executive department
-            if self.department == executive_department:
+            if self.department_id == executive_department_id:
                 raise ValidationError({"department": "Department heads cannot belong to the Executive department."})
             # Department must belong to a department
-            if not self.department:
+            if not self.department_id:
                 raise ValidationError({"department": "Department heads must have a department assigned."})
 
         super().clean()
@@ -78,34 +119,20 @@ class CustomUser(AbstractUser):
     def save(self, *args, **kwargs):
         # Call `clean()` to validate the data before saving
         self.full_clean()
+        adding = self._state.adding
         super().save(*args, **kwargs)
-        self.assign_role_permissions()
+        # Only touch permissions for new users or when the role changed
+        if adding or self.role != self._original_role:
+            self.assign_role_permissions(adding=adding)
+            self._original_role = self.role
 
     # Assign permissions based on the user's role.
-    def assign_role_permissions(self):
-        if self.is_department_head():
-            # Assign department head permissions
-            content_types = [
-                ContentType.objects.get_for_model(Policy),
-                ContentType.objects.get_for_model(Definition),
-                ContentType.objects.get_for_model(ProcedureStep),
-            ]
-            permissions = Permission.objects.filter(content_type__in=content_types, codename__in=[
-                'view_procedurestep','view_policy','view_definition', 'view_policyapprovalrequest'
-            ])
-            self.user_permissions.set(permissions)
-        elif self.is_executive():
-            # Assign executive permissions
-            content_types = [
-                ContentType.objects.get_for_model(Policy),
-                ContentType.objects.get_for_model(Definition),
-                ContentType.objects.get_for_model(ProcedureStep),
-            ]
-            permissions = Permission.objects.filter(content_type__in=content_types, codename__in=[
-                'view_procedurestep','view_policy','view_definition', 'view_policyapprovalrequest'
-            ])
-            self.user_permissions.set(permissions)
+    def assign_role_permissions(self, adding=False):
+        if self.is_department_head() or self.is_executive():
+            # Assign department head / executive permissions
+            self.user_permissions.set(permission_ids_for_role(self.role))
         else:
-            # Clear permissions for other roles
-            self.user_permissions.clear()
+            # Clear permissions for other roles, a user being created has none to clear
+            if not adding:
+                self.user_permissions.clear()
 
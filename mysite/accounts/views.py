@@ -1,10 +1,19 @@
 from django.urls import reverse_lazy, reverse
+from django.shortcuts import resolve_url
 from django.contrib.auth.views import LoginView
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.views.generic.edit import CreateView
 from django.views.generic import TemplateView
 from handbook.models import PolicyFeedback
 from .forms import CustomUserCreationForm, LoginForm
+from .models import CustomUser
+
+# Landing page for each role, given as a URL name or a plain path
+ROLE_TO_URL = {
+    CustomUser.DEPARTMENT_HEAD: 'department_head_admin:index',  # Department head portal
+    CustomUser.EXECUTIVE: 'executive_admin:index',  # Executive portal
+    CustomUser.EMPLOYEE: '/handbook/',  # Employees go to the handbook
+}
 
 # Signup view: Allows users to make a new account
 class SignUpView(CreateView):
@@ -23,15 +32,12 @@ class RoleBasedLoginView(LoginView):
 
         if user.is_superuser:
             return reverse('super_admin:index')  # Redirect super admin to their dashboard
-        elif user.is_department_head():
-            return reverse('department_head_admin:index')  # Redirect department head to their portal
-        elif user.is_executive():
-            return reverse('executive_admin:index')  # Redirect executives to their portal
-        elif user.is_employee():
-            return '/handbook/'  # Redirect employees to the handbook
-        else:
-            return '/'  # Default fallback if no role is set
 
+        target = ROLE_TO_URL.get(user.role, '/')  # Default fallback if no role is set
+        return resolve_url(target)
+
+
+PROFILE_FORMS_LIMIT = 50  # Cap on feedback forms listed on the profile page
 
 # Profile View: Allows users to view account info
 class UserProfileView(LoginRequiredMixin, TemplateView):
@@ -42,6 +48,11 @@ class UserProfileView(LoginRequiredMixin, TemplateView):
         user = self.request.user
         # Add user details to context
         context['user'] = user
-        # Fetch the user's submitted forms
-        context['submitted_forms'] = PolicyFeedback.objects.filter(email=user.email)
+        # Fetch the user's most recent submitted forms
+        context['submitted_forms'] = (
+            PolicyFeedback.objects.filter(email=user.email)
+            .select_related('policy')  # The template shows each feedback's policy title
+            .only('question', 'is_resolved', 'policy__title')
+            .order_by('-submitted_at')[:PROFILE_FORMS_LIMIT]
+        )
         return context
\ No newline at end of file
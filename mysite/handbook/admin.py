@@ -1,7 +1,9 @@
 from django.db import models
+from django.db.models.functions import Coalesce, NullIf
 from django.urls import reverse
 from django.http import HttpResponseRedirect
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
 from .models import PolicySection, Policy, Definition, PolicyFeedback, ProcedureStep, PolicyApprovalRequest, ArchivedPolicy
 from accounts.models import CustomUser, Department
 from accounts.admin import CustomUserAdmin, DepartmentAdmin
@@ -11,6 +13,52 @@ Custom admin sites for different user roles (Super Admins, Executives, Departmen
 Each site is tailored to match the permissions and views required by the respective roles.
 """
 
+# Role checks run many times per admin page, so each answer is remembered on the request
+def _is_department_head(request):
+    if not hasattr(request, "_is_department_head"):
+        request._is_department_head = request.user.is_authenticated and request.user.is_department_head()
+    return request._is_department_head
+
+def _is_executive(request):
+    if not hasattr(request, "_is_executive"):
+        request._is_executive = request.user.is_authenticated and request.user.is_executive()
+    return request._is_executive
+
+# Superusers, department heads and executives may edit a policy's steps and definitions
+def _is_policy_editor(request):
+    return request.user.is_superuser or _is_department_head(request) or _is_executive(request)
+
+# Superusers and admin-role users save directly instead of going through approval
+def _is_admin(request):
+    if not hasattr(request, "_is_admin"):
+        request._is_admin = request.user.is_superuser or (request.user.is_authenticated and request.user.is_admin())
+    return request._is_admin
+
+# Definitions linked to policies owned by the department head's department or created by them. Matching
+# the policy link in a subquery keeps one row per definition, so no DISTINCT is needed
+def _department_head_definitions(request):
+    department_links = Policy.definitions.through.objects.filter(
+        policy__policy_owner_id=request.user.department_id
+    ).values("definition_id")
+    return models.Q(pk__in=department_links) | models.Q(created_by=request.user)
+
+# Every inline row renders the same dropdown, so run the choices query once and replay it for each row
+def _shared_choices(choices):
+    cached = []
+    def load_choices():
+        if not cached:
+            cached.extend(iter(choices))  # Plain iteration, len() on model choices would add a COUNT query
+        return cached
+    return load_choices
+
+# Changelist that loads only the columns listed on the model admin's `changelist_only_fields`,
+# the change view keeps using the full get_queryset
+class OnlyFieldsChangeList(ChangeList):
+    def get_queryset(self, request, exclude_parameters=None):
+        queryset = super().get_queryset(request, exclude_parameters)
+        return queryset.only(*self.model_admin.changelist_only_fields)
+
+
 # Custom Admin site for Super Admins
 class SuperAdminSite(admin.AdminSite):
     # Define the headers and titles for the admin portal
@@ -35,7 +83,7 @@ class ExecutiveAdminSite(admin.AdminSite):
     def has_permission(self, request):
         if not request.user.is_authenticated:
             return False
-        return request.user.is_executive()
+        return _is_executive(request)
 
 # Instantiate the ExecutiveAdminSite
 executive_admin_site = ExecutiveAdminSite(name="executive_admin")
@@ -48,14 +96,18 @@ class DepartmentHeadAdminSite(admin.AdminSite):
     site_title = "Department Head Site Admin"
     index_title = "Welcome to the Department Head Dashboard"
     site_url = "/handbook/"
+    required_perms = frozenset(['handbook.view_procedurestep', 'handbook.view_definition'])
 
     # Restrict access to authenticated users with the department head role
     def has_permission(self, request):
         if not request.user.is_authenticated:
             return False
-        if request.user.is_department_head():
-            # Ensure department heads have permissions to view procedure steps and definitions
-            return request.user.has_perm('handbook.view_procedurestep') and request.user.has_perm('handbook.view_definition')
+        if _is_department_head(request):
+            # Ensure department heads have permissions to view procedure steps and definitions,
+            # checked once per request since the site asks on every view and template tag
+            if not hasattr(request, "_dh_has_permission"):
+                request._dh_has_permission = self.required_perms.issubset(request.user.get_all_permissions())
+            return request._dh_has_permission
         return False
 
 # Instantiate the DepartmentHeadAdminSite
@@ -72,19 +124,15 @@ class ProcedureStepInline(admin.TabularInline):
 
     # Permissions to add procedure steps
     def has_add_permission(self, request, obj=None):
-        return request.user.is_department_head() or request.user.is_superuser or request.user.is_executive()
+        return _is_policy_editor(request)
 
     # Permissions to edit procedure steps
     def has_change_permission(self, request, obj=None):
-        return request.user.is_department_head() or request.user.is_superuser or request.user.is_executive()
+        return _is_policy_editor(request)
 
     # Permissions to delete procedure steps
     def has_delete_permission(self, request, obj=None):
-        return request.user.is_department_head() or request.user.is_superuser or request.user.is_executive()
-
-    # Customize the queryset to ensure steps are always ordered by step number
-    def get_queryset(self, request):
-        return super().get_queryset(request).order_by('step_number')
+        return _is_policy_editor(request)
 
 
 # Inline configuration for Definitions in Policies
@@ -94,31 +142,31 @@ class DefinitionInline(admin.TabularInline):
     verbose_name = "Definition" # Label for a single definition
     verbose_name_plural = "Definitions" # Label for multiple definitions
 
+    # Join each through row's definition so read-only rows do not load it one by one
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related("definition")
+
     # Restrict available definitions to those related to department head's policies or created by the user
     def formfield_for_foreignkey(self, db_field, request, **kwargs):
         if db_field.name == "definition":
-            if request.user.is_department_head():
-                # Include definitions linked to policies owned by the department
-                department_definitions = Definition.objects.filter(
-                    policies__policy_owner=request.user.department
-                )
-                # Include definitions created by the user
-                user_created_definitions = Definition.objects.filter(created_by=request.user)
-                # Combine both querysets
-                kwargs["queryset"] = (department_definitions | user_created_definitions).distinct()
-        return super().formfield_for_foreignkey(db_field, request, **kwargs)
+            if _is_department_head(request):
+                kwargs["queryset"] = Definition.objects.filter(_department_head_definitions(request))
+        formfield = super().formfield_for_foreignkey(db_field, request, **kwargs)
+        if db_field.name == "definition":
+            formfield.choices = _shared_choices(formfield.choices)
+        return formfield
 
     # Permissions to add definitions
     def has_add_permission(self, request, obj=None):
-        return request.user.is_department_head() or request.user.is_superuser or request.user.is_executive()
+        return _is_policy_editor(request)
 
     # Permissions to edit definitions
     def has_change_permission(self, request, obj=None):
-        return request.user.is_department_head() or request.user.is_superuser or request.user.is_executive()
+        return _is_policy_editor(request)
 
     # Permissions to delete definitions
     def has_delete_permission(self, request, obj=None):
-        return request.user.is_department_head()  or request.user.is_superuser or request.user.is_executive()
+        return _is_policy_editor(request)
 
 
 # Admin configuration for Policy model
@@ -140,8 +188,30 @@ class PolicyAdmin(admin.ModelAdmin):
             "fields": ["related_policies"]
         }),
     ]
+    # Sections for adding policies, built once instead of on every get_fieldsets call
+    add_fieldsets = [
+        ("Policy Information", {
+            "fields": ["section", "title", "policy_owner", "review_period"]
+        }),
+        ("Policy Details", {
+            "fields": [
+                "purpose",
+                "scope",
+                "policy_statements",
+                "responsibilities"
+            ],
+        }),
+        ("Relationships", {
+            "fields": ["related_policies"]
+        }),
+    ]
     readonly_fields = ["number", "pub_date", "updated_at", "version", "policy_owner"]
     list_display = ["number", "title", "section", "policy_owner", "pub_date", "version"]
+    list_select_related = ["section", "policy_owner"]  # Join the FKs shown in the changelist
+    changelist_only_fields = [
+        "number", "title", "version", "pub_date", "section", "policy_owner",
+        "section__number", "section__title", "policy_owner__name",
+    ]
     list_filter = ["section", "policy_owner", "pub_date"]
     search_fields = ["title", "policy_statements", "section__title"]
     ordering = ["section", "number"]  # Default ordering of policies
@@ -150,25 +220,25 @@ class PolicyAdmin(admin.ModelAdmin):
     # Inline models for editing procedure steps and definitions
     inlines = [ProcedureStepInline, DefinitionInline]
 
+    # Join the section and owning department, which permission checks and readonly fields read
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related("section", "policy_owner")
+
+    # Skip the long text fields when listing policies
+    def get_changelist(self, request, **kwargs):
+        return OnlyFieldsChangeList
+
+    # The related policies widget lists every policy by number and title, so load only those columns
+    def formfield_for_manytomany(self, db_field, request, **kwargs):
+        formfield = super().formfield_for_manytomany(db_field, request, **kwargs)
+        if db_field.name == "related_policies":
+            formfield.queryset = formfield.queryset.only("id", "number", "title")
+        return formfield
+
     def get_fieldsets(self, request, obj=None):
         # Adjust fieldsets when creating a new policy
         if obj is None:  # Adding a new policy
-            return [
-                ("Policy Information", {
-                    "fields": ["section", "title", "policy_owner", "review_period"]
-                }),
-                ("Policy Details", {
-                    "fields": [
-                        "purpose",
-                        "scope",
-                        "policy_statements",
-                        "responsibilities"
-                    ],
-                }),
-                ("Relationships", {
-                    "fields": ["related_policies"]
-                }),
-            ]
+            return self.add_fieldsets
         return super().get_fieldsets(request, obj)
 
     # Dynamically adjust readonly fields based on user role and policy state:
@@ -177,7 +247,7 @@ class PolicyAdmin(admin.ModelAdmin):
         readonly_fields = self.readonly_fields.copy()
 
         # Remove `policy_owner` from readonly fields for superusers and admins
-        if request.user.is_superuser or request.user.is_admin():
+        if _is_admin(request):
             readonly_fields = [field for field in readonly_fields if field != "policy_owner"]
 
         # Add `section` to readonly fields when editing an existing policy
@@ -196,7 +266,7 @@ class PolicyAdmin(admin.ModelAdmin):
     # Save logic for creating and editing policies
     def save_model(self, request, obj, form, change):
         # Bypass approval workflow for superusers and admins
-        if request.user.is_superuser or request.user.is_admin():
+        if _is_admin(request):
             super().save_model(request, obj, form, change)
 
         else:
@@ -206,14 +276,14 @@ class PolicyAdmin(admin.ModelAdmin):
                 section_prefix = obj.section.number.split(".")[0]
                 policy_count = Policy.objects.filter(section=obj.section).count()
                 obj.number = f"{section_prefix}.{policy_count + 1}"
-                obj.policy_owner = request.user.department
+                obj.policy_owner_id = request.user.department_id
 
                 # Save unsaved changes to the session for creating a PolicyApprovalRequest
                 unsaved_changes = {
-                    "section": obj.section.id,
+                    "section": obj.section_id,
                     "number": obj.number,
                     "title": form.cleaned_data["title"],
-                    "policy_owner": obj.policy_owner.id if obj.policy_owner else None,
+                    "policy_owner": obj.policy_owner_id,
                     "review_period": form.cleaned_data["review_period"],
                     "purpose": form.cleaned_data["purpose"],
                     "scope": form.cleaned_data["scope"],
@@ -235,9 +305,9 @@ class PolicyAdmin(admin.ModelAdmin):
                         # For ForeignKey fields, store the primary key
                         if isinstance(field_obj, models.ForeignKey):
                             value = value.pk if value else None
-                        # For ManyToMany fields, store the list of related IDs
+                        # For ManyToMany fields, store the list of related IDs from the rows validation already loaded
                         elif isinstance(field_obj, models.ManyToManyField):
-                            value = list(value.values_list("id", flat=True))
+                            value = [related.id for related in value]
                         # Store the updated field value in the unsaved_changes
                         unsaved_changes[field] = value
 
@@ -249,10 +319,27 @@ class PolicyAdmin(admin.ModelAdmin):
             # Do not save changes to the database yet
             return
 
+    # Save inline rows directly: removed rows go in one DELETE and edited rows in one bulk UPDATE,
+    # new rows are saved individually so ProcedureStep.save can number them
+    def save_formset(self, request, form, formset, change):
+        formset.save(commit=False)
+
+        deleted_ids = [obj.pk for obj in formset.deleted_objects]
+        if deleted_ids:
+            formset.model.objects.filter(pk__in=deleted_ids).delete()
+
+        changed_fields = {name for obj, names in formset.changed_objects for name in names}
+        if changed_fields:
+            formset.model.objects.bulk_update([obj for obj, names in formset.changed_objects], changed_fields)
+
+        for obj in formset.new_objects:
+            obj.save()
+        formset.save_m2m()
+
     # Save related objects (e.g., related policies, procedure steps, definitions)
     def save_related(self, request, form, formsets, change):
         # Allow direct saving for superusers and admins
-        if request.user.is_superuser or request.user.is_admin():
+        if _is_admin(request):
             # Allow direct saving for superusers and admins
             super().save_related(request, form, formsets, change)
 
@@ -264,24 +351,24 @@ class PolicyAdmin(admin.ModelAdmin):
                 # Capture related policies for a new policy
                 related_policies = form.cleaned_data.get("related_policies", [])
                 if related_policies:
-                    # Store related policy IDs
-                    unsaved_changes["related_policies"] = list(related_policies.values_list("id", flat=True))
+                    # Store related policy IDs, read from the rows the form already loaded while validating
+                    unsaved_changes["related_policies"] = [related_policy.id for related_policy in related_policies]
 
                 procedure_steps = []
                 definitions = []
 
                 for formset in formsets:
                     if formset.model == ProcedureStep:
-                        for form in formset.forms:
-                            if not form.cleaned_data.get("DELETE", False):
+                        for inline_form in formset.forms:
+                            if not inline_form.cleaned_data.get("DELETE", False):
                                 procedure_steps.append({
-                                    "step_number": form.cleaned_data["step_number"],
-                                    "description": form.cleaned_data["description"],
+                                    "step_number": inline_form.cleaned_data["step_number"],
+                                    "description": inline_form.cleaned_data["description"],
                                 })
                     elif formset.model == Policy.definitions.through:
-                        for form in formset.forms:
-                            definition = form.cleaned_data.get("definition")
-                            if definition and not form.cleaned_data.get("DELETE", False):
+                        for inline_form in formset.forms:
+                            definition = inline_form.cleaned_data.get("definition")
+                            if definition and not inline_form.cleaned_data.get("DELETE", False):
                                 definitions.append({
                                     "id": definition.id,
                                     "term": definition.term,
@@ -292,16 +379,20 @@ class PolicyAdmin(admin.ModelAdmin):
                 # Retrieve the policy ID from the session
                 policy_id = request.session.get("policy_id")
                 if policy_id:
-                    # Fetch the policy object based on the policy ID
-                    policy = Policy.objects.get(id=policy_id)
-
                     # Retrieve any basic changes saved in the session for the policy
                     unsaved_changes = request.session.get("unsaved_policy_changes", {})
 
                     # Capture the list of related policies from the form data or use the existing related policies
-                    related_policies = form.cleaned_data.get("related_policies", policy.related_policies.all())
-                    # Store the related policy IDs in the unsaved_changes
-                    unsaved_changes["related_policies"] = list(related_policies.values_list("id", flat=True))
+                    related_policies = form.cleaned_data.get("related_policies")
+                    # Store the related policy IDs in the unsaved_changes, reading existing links from the join table
+                    if related_policies is None:
+                        unsaved_changes["related_policies"] = list(
+                            Policy.related_policies.through.objects.filter(
+                                from_policy_id=policy_id
+                            ).values_list("to_policy_id", flat=True)
+                        )
+                    else:
+                        unsaved_changes["related_policies"] = [related_policy.id for related_policy in related_policies]
 
                     procedure_steps = [] # To store all procedure step changes
                     definitions = [] # To store all definition changes
@@ -312,20 +403,11 @@ class PolicyAdmin(admin.ModelAdmin):
                         if formset.model == ProcedureStep:
                             updated_steps = [] # Temporarily store updated steps
 
-                            # Iterate over each form in the procedure steps formset
-                            for form in formset.forms:
-                                # If a step is marked for deletion, include it in the procedure_steps with DELETE flag
-                                if form.cleaned_data.get("DELETE", False):
-                                    obj = form.instance
-                                    procedure_steps.append({
-                                        "id": obj.id,
-                                        "step_number": obj.step_number,
-                                        "description": obj.description,
-                                        "DELETE": True,
-                                    })
-                                # Else include step in the procedure_steps with normal data
-                                else:
-                                    instance = form.instance
+                            # Iterate over each form in the procedure steps formset. Deleted steps are left out
+                            # of the session, since applying or submitting the changes replaces every step
+                            for inline_form in formset.forms:
+                                if not inline_form.cleaned_data.get("DELETE", False):
+                                    instance = inline_form.instance
                                     if instance.description: # Ensure meaningful data exists
                                         updated_steps.append(instance)
 
@@ -340,24 +422,15 @@ class PolicyAdmin(admin.ModelAdmin):
 
                         # Handle definitions
                         elif formset.model == Policy.definitions.through:
-                            # Iterate over each form in the definitions formset
-                            for form in formset.forms:
-                                definition_instance = form.cleaned_data.get("definition") # Retrieve the definition object
-                                if definition_instance:
-                                    # If marked for deletion, include it with the DELETE flag
-                                    if form.cleaned_data.get("DELETE", False):
-                                        definitions.append({
-                                            "id": definition_instance.id,
-                                            "term": definition_instance.term,
-                                            "definition": definition_instance.definition,
-                                            "DELETE": True,
-                                        })
-                                    # Else add the definition data to the unsaved changes
-                                    else:
-                                        definitions.append({
-                                            "id": definition_instance.id,
-                                            "term": definition_instance.term,
-                                            "definition": definition_instance.definition,
+                            # Iterate over each form in the definitions formset, leaving deleted definitions
+                            # out of the session since the policy's definitions are replaced as a whole
+                            for inline_form in formset.forms:
+                                definition_instance = inline_form.cleaned_data.get("definition") # Retrieve the definition object
+                                if definition_instance and not inline_form.cleaned_data.get("DELETE", False):
+                                    definitions.append({
+                                        "id": definition_instance.id,
+                                        "term": definition_instance.term,
+                                        "definition": definition_instance.definition,
                                     })
 
             # Update session with changes
@@ -365,14 +438,12 @@ class PolicyAdmin(admin.ModelAdmin):
             unsaved_changes["definitions"] = definitions
             request.session["unsaved_policy_changes"] = unsaved_changes
 
-            print("Save Related", unsaved_changes)
-
             # Do not save changes to the database yet
             return
 
     def response_change(self, request, obj):
         # Check if the user is a superuser or admin
-        if request.user.is_superuser or request.user.is_admin():
+        if _is_admin(request):
             # Admins bypass the questionnaire redirect
             return super().response_change(request, obj)
 
@@ -385,7 +456,7 @@ class PolicyAdmin(admin.ModelAdmin):
 
     # Response handling for adding new policies
     def response_add(self, request, obj, post_url_continue=None):
-        if request.user.is_superuser or request.user.is_admin():
+        if _is_admin(request):
             # Redirect directly for superusers and admins
             return HttpResponseRedirect(reverse("admin:handbook_policy_changelist"))
         else:
@@ -408,8 +479,8 @@ class PolicyAdmin(admin.ModelAdmin):
             submitter=request.user,
             request_type='new',
             status="pending",
-            policy_owner=Department.objects.get(id=unsaved_changes["policy_owner"]),
-            section=PolicySection.objects.get(id=unsaved_changes["section"]),
+            policy_owner_id=unsaved_changes["policy_owner"],  # Ids from the session, no need to load the rows
+            section_id=unsaved_changes["section"],
             proposed_title=unsaved_changes["title"],
             proposed_review_period=unsaved_changes["review_period"],
             proposed_purpose=unsaved_changes["purpose"],
@@ -423,45 +494,42 @@ class PolicyAdmin(admin.ModelAdmin):
 
     # Construct a change message that avoids accessing new_objects
     def construct_change_message(self, request, form, formsets, add=False):
+        if add:
+            return "Added new object."
         change_message = []
 
         # Capture changed fields in the form
         if form.changed_data:
             change_message.append(f"Changed fields: {', '.join(form.changed_data)}")
 
-        # Handle changes in formsets
+        # Handle changes in formsets, reading each formset property once
         for formset in formsets:
-            if hasattr(formset, 'deleted_forms') and formset.deleted_forms:
-                change_message.append(f"Deleted {len(formset.deleted_forms)} inline(s).")
-            if hasattr(formset, 'changed_objects') and formset.changed_objects:
-                change_message.append(f"Changed {len(formset.changed_objects)} inline(s).")
-            if hasattr(formset, 'added_forms') and formset.added_forms:
-                change_message.append(f"Added {len(formset.added_forms)} inline(s).")
+            deleted_forms = getattr(formset, 'deleted_forms', None)
+            if deleted_forms:
+                change_message.append(f"Deleted {len(deleted_forms)} inline(s).")
+            changed_objects = getattr(formset, 'changed_objects', None)
+            if changed_objects:
+                change_message.append(f"Changed {len(changed_objects)} inline(s).")
+            added_forms = getattr(formset, 'added_forms', None)
+            if added_forms:
+                change_message.append(f"Added {len(added_forms)} inline(s).")
 
-        if add:
-            return "Added new object."
         return " ".join(change_message) if change_message else "No changes detected."
 
 
 # Executive Configuration of Policy Model
 class PolicyAdminForExecutive(PolicyAdmin):
-    inlines = [ProcedureStepInline, DefinitionInline]
-
     # Grant module access only to executives
     def has_module_permission(self, request):
-        return request.user.is_executive()
+        return _is_executive(request)
 
     # Grant module access only to executives
     def has_change_permission(self, request, obj=None):
-        return request.user.is_executive()
+        return _is_executive(request)
 
     # Allow executives to add new policies
     def has_add_permission(self, request):
-        return request.user.is_executive()
-
-    # Executives can view all policies
-    def get_queryset(self, request):
-        return super().get_queryset(request)
+        return _is_executive(request)
 
     # Executives cannot delete policies
     def has_delete_permission(self, request, obj=None):
@@ -470,40 +538,38 @@ class PolicyAdminForExecutive(PolicyAdmin):
 
 # Department Head Configuration of Policy Model
 class PolicyAdminForDepartmentHead(PolicyAdmin):
-    inlines = [ProcedureStepInline, DefinitionInline]
-
     # Grant module access only to department heads
     def has_module_permission(self, request):
-        return request.user.is_department_head()
+        return _is_department_head(request)
 
     # Allow department heads to view policies within their department
     def has_view_permission(self, request, obj=None):
-        if request.user.is_department_head():
-            return obj is None or obj.policy_owner == request.user.department
+        if _is_department_head(request):
+            return obj is None or obj.policy_owner_id == request.user.department_id
         return super().has_view_permission(request, obj)
 
     # Allow department heads to edit policies within their department
     def has_change_permission(self, request, obj=None):
-        if request.user.is_department_head():
-            return obj and obj.policy_owner == request.user.department
+        if _is_department_head(request):
+            return obj and obj.policy_owner_id == request.user.department_id
         return super().has_change_permission(request, obj)
 
     # Allow department heads to add policies to their department
     def has_add_permission(self, request):
-        return request.user.is_department_head()
+        return _is_department_head(request)
 
     # Customize the list filter for department heads
     def get_list_filter(self, request):
         # Limit to only filter by section and publish date
-        if request.user.is_department_head():
+        if _is_department_head(request):
             return ('section', 'pub_date')
         return super().get_list_filter(request)
 
     # Restrict policies to those belonging to the department head's department
     def get_queryset(self, request):
         qs = super().get_queryset(request)
-        if request.user.is_department_head() and request.user.department:
-            qs = qs.filter(policy_owner=request.user.department)
+        if _is_department_head(request) and request.user.department_id:
+            qs = qs.filter(policy_owner_id=request.user.department_id)
         return qs
 
 
@@ -519,14 +585,27 @@ class PolicyFeedbackAdmin(admin.ModelAdmin):
     ]
     readonly_fields = ('policy', 'first_name', 'last_name', 'email', 'question', 'submitted_at')
     list_display = ('policy', 'first_name', 'last_name', 'email', 'submitted_at', 'is_resolved')
+    list_select_related = ('policy',)  # Join the policy shown in the changelist
+    changelist_only_fields = (
+        'policy', 'first_name', 'last_name', 'email', 'submitted_at', 'is_resolved',
+        'policy__number', 'policy__title',
+    )
     list_filter = ('is_resolved', 'submitted_at', 'policy__section')
     search_fields = ('first_name', 'last_name', 'email', 'question', 'policy__title', 'policy__section__title')
     ordering = ('-submitted_at',)  # Default ordering: newest submissions first
+    list_per_page = 50
+    list_max_show_all = 200
+    show_full_result_count = False  # Skip the unfiltered COUNT(*) when searching or filtering
+
+    # Skip the question and notes text when listing feedback
+    def get_changelist(self, request, **kwargs):
+        return OnlyFieldsChangeList
 
     actions = ['mark_feedbacks_resolved'] # Custom admin action
     # Custom admin action to mark selected feedback as resolved
     def mark_feedbacks_resolved(self, request, queryset):
-        count = queryset.update(is_resolved=True) # Update the is_resolved field for selected feedbacks
+        # Update the is_resolved field for selected feedbacks in one query, skipping rows already resolved
+        count = queryset.filter(is_resolved=False).update(is_resolved=True)
         self.message_user(request, f"{count} feedback(s) marked as resolved.") # Display a success message
     # Description for the action
     mark_feedbacks_resolved.short_description = "Mark selected feedbacks as resolved"
@@ -540,25 +619,25 @@ class PolicyFeedbackAdmin(admin.ModelAdmin):
 class PolicyFeedbackAdminForDepartmentHead(PolicyFeedbackAdmin):
     # Grant module access only to department heads
     def has_module_permission(self, request):
-        return request.user.is_department_head()
+        return _is_department_head(request)
 
     # Allow department heads to view feedback for their department's policies
     def has_view_permission(self, request, obj=None):
-        if request.user.is_department_head():
-            return obj is None or obj.policy.policy_owner == request.user.department
+        if _is_department_head(request):
+            return obj is None or obj.policy.policy_owner_id == request.user.department_id
         return super().has_view_permission(request, obj)
 
     # Allow department heads to resolve feedback for their department's policies
     def has_change_permission(self, request, obj=None):
-        if request.user.is_department_head():
-            return obj and obj.policy.policy_owner == request.user.department
+        if _is_department_head(request):
+            return obj and obj.policy.policy_owner_id == request.user.department_id
         return super().has_change_permission(request, obj)
 
     # Restrict queryset to feedback related to policies within the department head's department
     def get_queryset(self, request):
         qs = super().get_queryset(request)
-        if request.user.is_department_head():
-            return qs.filter(policy__policy_owner=request.user.department)
+        if _is_department_head(request):
+            return qs.filter(policy__policy_owner_id=request.user.department_id)
         return qs
 
 
@@ -596,19 +675,15 @@ class DefinitionAdmin(admin.ModelAdmin):
 class DefinitionAdminForExecutive(DefinitionAdmin):
     # Grant module access only to executives
     def has_module_permission(self, request):
-        return request.user.is_executive()
-
-    # Allow executives to view all definitions
-    def get_queryset(self, request):
-        return super().get_queryset(request)
+        return _is_executive(request)
 
     # Allow executives to add new definitions
     def has_add_permission(self, request):
-        return request.user.is_executive()
+        return _is_executive(request)
 
     # Allow executives to edit definitions
     def has_change_permission(self, request, obj=None):
-        return request.user.is_executive()
+        return _is_executive(request)
 
     # Executives cannot delete definitions
     def has_delete_permission(self, request, obj=None):
@@ -620,32 +695,37 @@ class DefinitionAdminForDepartmentHead(DefinitionAdmin):
     # Restrict queryset to definitions related to policies owned by the department or created by the department head
     def get_queryset(self, request):
         qs = super().get_queryset(request)
-        if request.user.is_department_head():
-            # Include definitions linked to policies owned by the department
-            linked_definitions = qs.filter(policies__policy_owner=request.user.department)
-            # Include definitions created by the current user (assuming a creator field)
-            user_created_definitions = qs.filter(created_by=request.user)
-            # Combine both querysets
-            return (linked_definitions | user_created_definitions).distinct()
+        if _is_department_head(request):
+            return qs.filter(_department_head_definitions(request))
         return qs
 
+    # Allow if the definition was created by the user or is linked to a policy owned by their department.
+    # The admin asks several times per page, so each answer is remembered on the request
+    def _can_access(self, request, obj):
+        if not hasattr(request, "_definition_access"):
+            request._definition_access = {}
+        if obj.pk not in request._definition_access:
+            request._definition_access[obj.pk] = (
+                obj.created_by_id == request.user.id
+                or obj.policies.filter(policy_owner_id=request.user.department_id).exists()
+            )
+        return request._definition_access[obj.pk]
+
     # Allow department heads to view definitions linked to their department's policies or their own
     def has_view_permission(self, request, obj=None):
-        if request.user.is_department_head():
-            # Allow if the definition is linked to a policy owned by their department or created by the user
-            return obj is None or obj.policies.filter(policy_owner=request.user.department).exists() or obj.created_by == request.user
+        if _is_department_head(request):
+            return obj is None or self._can_access(request, obj)
         return super().has_view_permission(request, obj)
 
     # Allow department heads to edit definitions linked to their department's policies or their own
     def has_change_permission(self, request, obj=None):
-        if request.user.is_department_head():
-            # Allow if the definition is linked to a policy owned by their department or created by the user
-            return obj is None or obj.policies.filter(policy_owner=request.user.department).exists() or obj.created_by == request.user
+        if _is_department_head(request):
+            return obj is None or self._can_access(request, obj)
         return super().has_change_permission(request, obj)
 
     # Allow department heads to add definitions
     def has_add_permission(self, request):
-        return request.user.is_department_head()
+        return _is_department_head(request)
 
     # Restrict department heads from deleting definitions
     def has_delete_permission(self, request, obj=None):
@@ -680,91 +760,124 @@ class PolicySectionAdmin(admin.ModelAdmin):
 # Admin configuration for Policy Approval Request
 class PolicyApprovalRequestAdmin(admin.ModelAdmin):
     list_display = ["get_policy_or_proposed_title", "request_type",  "status", "submitter", "submitted_at"]
+    # Load only the listed columns and the titles the row's action checkbox label (__str__) reads,
+    # the joined relations otherwise contribute only their ids
+    changelist_only_fields = [
+        "request_type", "status", "submitted_at", "proposed_title", "submitter__username",
+        "policy__id", "policy__title", "archived_policy__id", "archived_policy__title",
+        "section__id", "policy_owner__id", "approver__id",
+    ]
 
     # Determines the displayed field
     def get_policy_or_proposed_title(self, obj):
-        if obj.request_type == 'new':
-            return obj.proposed_title or "No Title Proposed"
-        elif obj.request_type in ['edit', 'archive'] and obj.policy:
-            return obj.policy.title
-        elif obj.archived_policy:
-            return obj.archived_policy.title
-        return "No Policy Linked"
+        return obj.display_title
 
     get_policy_or_proposed_title.short_description = "Policy"
+    get_policy_or_proposed_title.admin_order_field = "display_title"
 
     list_filter = ["status", "request_type", "section", "submitted_at"]
     ordering = ["-submitted_at",]
+    list_per_page = 50
+    show_full_result_count = False  # Skip the unfiltered COUNT(*) when filtering
+
+    # Join the policy, section, owner and users shown on the change form and checked for permissions,
+    # and compute the displayed title in the query so the changelist can sort by it
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related(
+            "policy", "archived_policy", "section", "policy_owner", "submitter", "approver"
+        ).annotate(
+            display_title=models.Case(
+                models.When(
+                    request_type="new",
+                    then=Coalesce(NullIf("proposed_title", models.Value("")), models.Value("No Title Proposed")),
+                ),
+                models.When(request_type__in=["edit", "archive"], policy__isnull=False, then="policy__title"),
+                models.When(archived_policy__isnull=False, then="archived_policy__title"),
+                default=models.Value("No Policy Linked"),
+            )
+        )
+
+    # Skip the proposed policy text and JSON when listing requests
+    def get_changelist(self, request, **kwargs):
+        return OnlyFieldsChangeList
+
+    # Approval requests are only ever edited through their status and notes
+    base_readonly_fields = (
+        "policy", "section", "number", "policy_owner", "submitter",
+        "approver", "submitted_at", "updated_at", "current_review_period",
+        "current_version", "current_title", "current_purpose", "current_scope",
+        "current_policy_statements", "current_responsibilities",
+        "current_related_policies", "current_procedure_steps",
+        "current_definitions",
+        "get_proposed_title",
+        "get_proposed_review_period",
+        "get_proposed_purpose",
+        "get_proposed_scope",
+        "get_proposed_policy_statements",
+        "get_proposed_responsibilities",
+        "get_proposed_related_policies",
+        "get_proposed_procedure_steps",
+        "get_proposed_definitions",
+    )
+    closed_readonly_fields = base_readonly_fields + ("status", "notes")
+    closed_statuses = frozenset(["approved", "rejected", "revision_needed"])
 
     def get_readonly_fields(self, request, obj=None):
-        readonly_fields = [
-                "policy", "section", "number", "policy_owner", "submitter",
-                "approver", "submitted_at", "updated_at", "current_review_period",
-                "current_version", "current_title", "current_purpose", "current_scope",
-                "current_policy_statements", "current_responsibilities",
-                "current_related_policies", "current_procedure_steps",
-                "current_definitions",
-                    "get_proposed_title",
-                    "get_proposed_review_period",
-                    "get_proposed_purpose",
-                    "get_proposed_scope",
-                    "get_proposed_policy_statements",
-                    "get_proposed_responsibilities",
-                    "get_proposed_related_policies",
-                    "get_proposed_procedure_steps",
-                    "get_proposed_definitions",
-            ]
         if obj:
             # For approved/rejected requests, all fields are readonly
-            if obj.status in ["approved", "rejected", "revision_needed"]:
-                return readonly_fields + [
-                    "status", "notes"
-                ]
-            return readonly_fields
+            if obj.status in self.closed_statuses:
+                return self.closed_readonly_fields
+            return self.base_readonly_fields
         return super().get_readonly_fields(request, obj)
 
-    # Dynamically adjust fieldsets based on the `request_type` of the policy approval request
-    def get_fieldsets(self, request, obj=None):
-        base_fieldsets = [
-            ("Approval Details", {
-                "fields": ("status", "notes", "approver", "submitted_at", "updated_at"),
+    approval_fieldset = ("Approval Details", {
+        "fields": ("status", "notes", "approver", "submitted_at", "updated_at"),
+    })
+    current_policy_fields = [
+        "section", "current_title", "current_version", "policy_owner", "current_review_period",
+        "current_purpose", "current_scope", "current_policy_statements", "current_responsibilities",
+        "current_related_policies", "current_procedure_steps", "current_definitions",
+    ]
+
+    # Fieldsets for each `request_type`, built once rather than on every call
+    request_type_fieldsets = {
+        "edit": [
+            ("Current Policy Details", {"fields": current_policy_fields}),
+            ("Proposed Changes",  {
+                "fields": [
+                    "get_proposed_title", "get_proposed_review_period", "get_proposed_purpose",
+                    "get_proposed_scope", "get_proposed_policy_statements", "get_proposed_responsibilities",
+                    "get_proposed_related_policies","get_proposed_procedure_steps", "get_proposed_definitions",
+                ],
             }),
-        ]
+            approval_fieldset,
+        ],
+        "new": [
+            ("New Policy Details", {
+                "fields": [
+                    "section", "get_proposed_title", "policy_owner", "get_proposed_review_period",
+                    "get_proposed_purpose", "get_proposed_scope", "get_proposed_policy_statements",
+                    "get_proposed_responsibilities", "get_proposed_related_policies", "get_proposed_procedure_steps",
+                    "get_proposed_definitions",
+                ],
+            }),
+            approval_fieldset,
+        ],
+        "archive": [
+            ("Policy Details", {"fields": current_policy_fields}),
+            approval_fieldset,
+        ],
+    }
+    default_fieldsets = [approval_fieldset]
 
+    # Dynamically adjust fieldsets based on the `request_type` of the policy approval request
+    def get_fieldsets(self, request, obj=None):
         if obj:
-            if obj.request_type == "edit":
-                base_fieldsets.insert(0, ("Current Policy Details", {
-                    "fields": [
-                        "section", "current_title", "current_version", "policy_owner", "current_review_period",
-                        "current_purpose", "current_scope", "current_policy_statements", "current_responsibilities",
-                        "current_related_policies", "current_procedure_steps", "current_definitions",
-                    ],
-                }))
-                base_fieldsets.insert(1, ("Proposed Changes",  {
-                    "fields": [
-                        "get_proposed_title", "get_proposed_review_period", "get_proposed_purpose",
-                        "get_proposed_scope", "get_proposed_policy_statements", "get_proposed_responsibilities",
-                        "get_proposed_related_policies","get_proposed_procedure_steps", "get_proposed_definitions",
-                    ],
-                }))
-            elif obj.request_type == "new":
-                base_fieldsets.insert(0, ("New Policy Details", {
-                    "fields": [
-                        "section", "get_proposed_title", "policy_owner", "get_proposed_review_period",
-                        "get_proposed_purpose", "get_proposed_scope", "get_proposed_policy_statements",
-                        "get_proposed_responsibilities", "get_proposed_related_policies", "get_proposed_procedure_steps",
-                        "get_proposed_definitions",
-                    ],
-                }))
-            elif obj.request_type == "archive" and obj.status != "approved":
-                base_fieldsets.insert(0, ("Policy Details", {
-                    "fields": [
-                        "section", "current_title", "current_version", "policy_owner", "current_review_period", "current_purpose",
-                        "current_scope", "current_policy_statements", "current_responsibilities", "current_related_policies",
-                        "current_procedure_steps", "current_definitions",
-                    ],
-                }))
-        return base_fieldsets
+            # Approved archive requests no longer show the archived policy's details
+            if obj.request_type == "archive" and obj.status == "approved":
+                return self.default_fieldsets
+            return self.request_type_fieldsets.get(obj.request_type, self.default_fieldsets)
+        return self.default_fieldsets
 
     # Computed fields for the current policy
     # These methods retrieve and display data from the current policy associated with the approval request
@@ -790,13 +903,14 @@ class PolicyApprovalRequestAdmin(admin.ModelAdmin):
         return obj.policy.responsibilities
 
     def current_related_policies(self, obj):
-        # Format the related policies as a list
-        return "\n".join([str(policy) for policy in obj.policy.related_policies.all()]) or "None"
+        # Format the related policies as a list, loading only the number and title they display
+        policies = obj.policy.related_policies.only("id", "number", "title")
+        return "\n".join([str(policy) for policy in policies]) or "None"
 
     def current_procedure_steps(self, obj):
         # Format procedure steps as a numbered list
         return "\n".join(
-            [f"Step {step.step_number}: {step.description}" for step in ProcedureStep.objects.filter(policy=obj.policy).order_by("step_number")]
+            [f"Step {step.step_number}: {step.description}" for step in obj.policy.procedure_steps.all()]
         ) or "None"
 
     def current_definitions(self, obj):
@@ -839,21 +953,19 @@ class PolicyApprovalRequestAdmin(admin.ModelAdmin):
 
     def get_proposed_related_policies(self, obj):
         # Format the proposed related policies as a list
-        policies = Policy.objects.filter(id__in=obj.proposed_related_policies)
-        return "\n".join(str(policy) for policy in policies) if policies else "None"
+        policies = Policy.objects.filter(id__in=obj.proposed_related_policies or []).only("id", "number", "title")
+        return "\n".join([str(policy) for policy in policies]) if policies else "None"
 
     def get_proposed_procedure_steps(self, obj):
         # Format proposed procedure steps as a numbered list
         return "\n".join(
-            f"Step {step['step_number']}: {step['description']}"
-            for step in obj.proposed_procedure_steps
+            [f"Step {step['step_number']}: {step['description']}" for step in obj.proposed_procedure_steps]
         ) if obj.proposed_procedure_steps else "None"
 
     def get_proposed_definitions(self, obj):
         # Format proposed definitions as a list of terms with their corresponding definitions
         return "\n".join(
-            f"{definition['term']}: {definition['definition']}"
-            for definition in obj.proposed_definitions
+            [f"{definition['term']}: {definition['definition']}" for definition in obj.proposed_definitions]
         ) if obj.proposed_definitions else "None"
 
     # Short descriptions for the proposed changes
@@ -873,11 +985,11 @@ class PolicyApprovalRequestAdmin(admin.ModelAdmin):
 
     def has_change_permission(self, request, obj=None):
         if obj:
-            if request.user.is_executive() or request.user.is_admin() or request.user.is_superuser:
-                if obj.submitter == request.user:
+            if _is_executive(request) or _is_admin(request):
+                if obj.submitter_id == request.user.id:
                     return False  # Cannot apporve of own policy
                 # Executives can edit requests they didn't submit unless approved/rejected
-                return obj.status not in ["approved", "rejected", "revision_needed"]
+                return obj.status not in self.closed_statuses
         return super().has_change_permission(request, obj)
 
     # Handle status changes
@@ -891,6 +1003,10 @@ class PolicyApprovalRequestAdmin(admin.ModelAdmin):
             # Notify submitter if the request requires revision or is rejected
             # elif obj.status in ["revision_needed", "rejected"]:
 
+            # Save the changes, writing only the review columns instead of every proposed field
+            obj.save(update_fields=["status", "notes", "approver", "updated_at"])
+            return
+
         # Save the changes
         super().save_model(request, obj, form, change)
 
@@ -898,7 +1014,7 @@ class PolicyApprovalRequestAdmin(admin.ModelAdmin):
 # Executive configuration for Policy Approval Request
 class PolicyApprovalRequestAdminForExecutive(PolicyApprovalRequestAdmin):
     def has_view_permission(self, request, obj=None):
-        return request.user.is_executive()
+        return _is_executive(request)
 
 
 # Dept Head configuration for Policy Approval Request
@@ -906,11 +1022,11 @@ class PolicyApprovalRequestAdminForDeptHead(PolicyApprovalRequestAdmin):
     # Filter queryset for department heads
     def get_queryset(self, request):
         qs = super().get_queryset(request)
-        return qs.filter(policy_owner=request.user.department)
+        return qs.filter(policy_owner_id=request.user.department_id)
 
     # Allow viewing only if the request belongs to the user's department
     def has_view_permission(self, request, obj=None):
-        return obj is None or obj.policy_owner == request.user.department
+        return obj is None or obj.policy_owner_id == request.user.department_id
 
     def has_change_permission(self, request, obj=None):
         return False
@@ -939,8 +1055,15 @@ class ArchivedPolicyAdmin(admin.ModelAdmin):
         }),
     ]
     list_display = ["number", "title", "section", "policy_owner", "archived_at"]
+    list_select_related = ["section", "policy_owner"]  # Join the FKs shown in the changelist
+    changelist_only_fields = [
+        "number", "title", "archived_at", "section", "policy_owner",
+        "section__number", "section__title", "policy_owner__name",
+    ]
     search_fields = ["title", "number", "section__title"]
     list_filter = ["section", "archived_at"]
+    list_per_page = 50
+    show_full_result_count = False  # Skip the unfiltered COUNT(*) when searching or filtering
     readonly_fields = [
         'section',
         'number',
@@ -958,19 +1081,22 @@ class ArchivedPolicyAdmin(admin.ModelAdmin):
         'formatted_definitions',
     ]
 
+    # Skip the archived policy text and step snapshot when listing archives
+    def get_changelist(self, request, **kwargs):
+        return OnlyFieldsChangeList
+
     # Format Some Fields
     def formatted_related_policies(self, obj):
         related_policies = obj.related_policies.all()
         if not related_policies:
             return "None"
-        return "\n".join(str(policy) for policy in related_policies)
+        return "\n".join([str(policy) for policy in related_policies])
 
     def formatted_procedure_steps(self, obj):
         if not obj.procedure_steps_json:
             return "None"
         return "\n".join(
-            f"Step {step['step_number']}: {step['description']}"
-            for step in obj.procedure_steps_json
+            [f"Step {step['step_number']}: {step['description']}" for step in obj.procedure_steps_json]
         )
 
     def formatted_definitions(self, obj):
@@ -978,7 +1104,7 @@ class ArchivedPolicyAdmin(admin.ModelAdmin):
         if not definitions:
             return "None"
         return "\n".join(
-            f"{definition.term}: {definition.definition}" for definition in definitions
+            [f"{definition.term}: {definition.definition}" for definition in definitions]
         )
 
     formatted_related_policies.short_description = "Related Policies"
@@ -987,7 +1113,7 @@ class ArchivedPolicyAdmin(admin.ModelAdmin):
 
     # Restrict view and edit permissions
     def has_view_permission(self, request, obj=None):
-        return request.user.is_executive()
+        return _is_executive(request)
 
     def has_change_permission(self, request, obj=None):
         return False
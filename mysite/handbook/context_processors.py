@@ -1,7 +1,23 @@
-from .models import PolicySection
+from django.core.cache import cache
+from django.db.models import Prefetch
+from django.utils.functional import SimpleLazyObject
+from .models import PolicySection, Policy, NAV_SECTIONS_CACHE_KEY
 
-# Add all policy sections to the context for the nav bar
+NAV_SECTIONS_TIMEOUT = 300  # Seconds, bounds staleness in other processes when the cache is not shared
+
+# The nav bar only needs each section's number, title and first policy id, so the sections are
+# cached with their policy ids and rebuilt when a section or policy changes
+def get_nav_sections():
+    sections = cache.get(NAV_SECTIONS_CACHE_KEY)
+    if sections is None:
+        sections = list(PolicySection.objects.prefetch_related(
+            Prefetch('policies', queryset=Policy.objects.only('id', 'section'))
+        ))
+        cache.set(NAV_SECTIONS_CACHE_KEY, sections, NAV_SECTIONS_TIMEOUT)
+    return sections
+
+# Add all policy sections to the context for the nav bar, loaded only if a template uses them
 def policy_sections_context(request):
     if request.user.is_authenticated:
-        return {'sections': PolicySection.objects.all()}
+        return {'sections': SimpleLazyObject(get_nav_sections)}
     return {}
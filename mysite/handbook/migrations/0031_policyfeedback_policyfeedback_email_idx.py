@@ -0,0 +1,17 @@
+# Generated by Django 5.1.2 on 2026-10-15 22:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('handbook', '0030_rename_policyrequest_policyfeedback_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='policyfeedback',
+            index=models.Index(fields=['email'], name='policyfeedback_email_idx'),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.1.2 on 2026-10-15 22:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0007_customuser_user_dept_role_idx_and_more'),
+        ('handbook', '0031_policyfeedback_policyfeedback_email_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='policy',
+            index=models.Index(fields=['section', 'number'], name='policy_section_number_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='policy',
+            index=models.Index(fields=['pub_date'], name='policy_pub_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='policyfeedback',
+            index=models.Index(fields=['-submitted_at'], name='policyfeedback_submitted_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='policyfeedback',
+            index=models.Index(fields=['is_resolved', 'submitted_at'], name='policyfeedback_resolved_idx'),
+        ),
+    ]
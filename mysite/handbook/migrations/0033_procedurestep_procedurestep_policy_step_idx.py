@@ -0,0 +1,17 @@
+# Generated by Django 5.1.2 on 2026-10-15 22:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('handbook', '0032_policy_policy_section_number_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='procedurestep',
+            index=models.Index(fields=['policy', 'step_number'], name='procedurestep_policy_step_idx'),
+        ),
+    ]
@@ -1,7 +1,11 @@
 from django.db import models, transaction
 from django.db.models import JSONField
 from django.conf import settings
+from django.core.cache import cache
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
 from django.core.exceptions import ValidationError
+from django.utils import timezone
 
 """
 Model definitions for the handbook application.
@@ -38,10 +42,13 @@ class PolicySection(models.Model):
         if old_number and old_number != self.number:
             section_prefix = self.number.split(".")[0]
             # Retrieve all policies associated with this section
-            policies = self.policies.all().order_by('pk')  # Maintain policy sequence
+            policies = list(self.policies.order_by('pk').only('id', 'number'))  # Maintain policy sequence
+            updated_at = timezone.now()  # bulk_update skips auto_now, so stamp it ourselves
             for index, policy in enumerate(policies, start=1):
                 policy.number = f"{section_prefix}.{index}"
-                policy.save()
+                policy.updated_at = updated_at
+            # Write every renumbered policy in a single query
+            Policy.objects.bulk_update(policies, ['number', 'updated_at'])
 
     class Meta:
         verbose_name = "Policy Section"  # Singular form
@@ -117,6 +124,10 @@ class Policy(models.Model):
     class Meta:
         verbose_name = "Policy"  # Singular form
         verbose_name_plural = "Policies"  # Plural form
+        indexes = [
+            models.Index(fields=['section', 'number'], name='policy_section_number_idx'),  # Default admin ordering
+            models.Index(fields=['pub_date'], name='policy_pub_date_idx'),  # Admin date filter
+        ]
 
 
 # Represents individual procedure steps linked to a policy
@@ -127,6 +138,9 @@ class ProcedureStep(models.Model):
 
     class Meta:
         ordering = ['step_number']  # Steps will be ordered by their step number
+        indexes = [
+            models.Index(fields=['policy', 'step_number'], name='procedurestep_policy_step_idx'),  # A policy's steps in order
+        ]
 
     # Display the procedure step using its number and truncated description
     def __str__(self):
@@ -272,14 +286,12 @@ class PolicyApprovalRequest(models.Model):
             )
             new_policy.related_policies.set(Policy.objects.filter(id__in=self.proposed_related_policies))
 
-            for step in self.proposed_procedure_steps:
-                ProcedureStep.objects.create(
-                    policy=new_policy,
-                    step_number=step["step_number"],
-                    description=step["description"],
-                )
-            for definition in self.proposed_definitions:
-                new_policy.definitions.add(Definition.objects.get(id=definition["id"]))
+            # Insert all steps and definition links at once, numbering steps in order as ProcedureStep.save would
+            ProcedureStep.objects.bulk_create([
+                ProcedureStep(policy=new_policy, step_number=number, description=step["description"])
+                for number, step in enumerate(self.proposed_procedure_steps, start=1)
+            ])
+            new_policy.definitions.add(*[definition["id"] for definition in self.proposed_definitions])
             new_policy.save()
             self.policy = new_policy
             self.save()
@@ -300,20 +312,16 @@ class PolicyApprovalRequest(models.Model):
             minor = 0
             self.policy.version = f"{major}.{minor}"
 
-            # Delete existing Procedure Steps and replace with new ones
+            # Delete existing Procedure Steps and replace with new ones in a single insert
             self.policy.procedure_steps.all().delete()
-            for step in self.proposed_procedure_steps:
-                ProcedureStep.objects.create(
-                    policy=self.policy,
-                    step_number=step["step_number"],
-                    description=step["description"],
-                )
+            ProcedureStep.objects.bulk_create([
+                ProcedureStep(policy=self.policy, step_number=number, description=step["description"])
+                for number, step in enumerate(self.proposed_procedure_steps, start=1)
+            ])
 
             # Remove all current definitions and add new ones
             self.policy.definitions.clear()
-            for definition in self.proposed_definitions:
-                definition_instance = Definition.objects.get(id=definition["id"])
-                self.policy.definitions.add(definition_instance)
+            self.policy.definitions.add(*[definition["id"] for definition in self.proposed_definitions])
 
             # Save the updated policy
             self.policy.save()
@@ -420,4 +428,19 @@ class PolicyFeedback(models.Model):
 
     class Meta:
         verbose_name = "Policy Feedback"  # Singular form
-        verbose_name_plural = "Policy Feedback"  # Plural form
\ No newline at end of file
+        verbose_name_plural = "Policy Feedback"  # Plural form
+        indexes = [
+            models.Index(fields=['email'], name='policyfeedback_email_idx'),  # Profile page looks up feedback by email
+            models.Index(fields=['-submitted_at'], name='policyfeedback_submitted_idx'),  # Newest first in the admin
+            models.Index(fields=['is_resolved', 'submitted_at'], name='policyfeedback_resolved_idx'),  # Admin filters
+        ]
+
+
+# Cache key for the nav bar sections built by the policy_sections_context context processor
+NAV_SECTIONS_CACHE_KEY = 'handbook:nav_sections'
+
+# Rebuild the nav bar sections after any section or policy is saved or deleted
+@receiver([post_save, post_delete], sender=PolicySection)
+@receiver([post_save, post_delete], sender=Policy)
+def clear_nav_sections(sender, **kwargs):
+    cache.delete(NAV_SECTIONS_CACHE_KEY)
@@ -1,7 +1,18 @@
+import logging
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from django.conf import settings
+from django.db import transaction
 import json
 
+logger = logging.getLogger(__name__)
+
+MAILGUN_TIMEOUT = 10  # Seconds to wait on the Mailgun API before giving up
+
+# Background workers for outgoing email. Bounded so a slow Mailgun cannot pile up threads, and
+# joined at interpreter exit so queued mail is still sent when the worker shuts down
+_email_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="mailgun")
+
 def send_mailgun_email(to_email, subject, variables):
     response = requests.post(
         f"https://api.mailgun.net/v3/{settings.MAILGUN_DOMAIN}/messages",
@@ -13,8 +24,23 @@ def send_mailgun_email(to_email, subject, variables):
             "template": "Policy Request Received",
             "h:X-Mailgun-Variables":  json.dumps(variables),
         },
+        timeout=MAILGUN_TIMEOUT,
     )
     if response.status_code != 200:
         # Log the error or raise an exception
-        print(f"Failed to send email: {response.text}")
+        logger.error("Failed to send email: %s", response.text)
     return response
+
+# Background task body, nothing above it would see an exception so failures are logged here
+def _send_mailgun_email_logged(to_email, subject, variables):
+    try:
+        send_mailgun_email(to_email=to_email, subject=subject, variables=variables)
+    except requests.RequestException:
+        logger.exception("Failed to send email to %s", to_email)
+
+# Send the email from a background worker once the current transaction commits,
+# so the user's response does not wait on the Mailgun API
+def send_mailgun_email_in_background(to_email, subject, variables):
+    transaction.on_commit(
+        lambda: _email_executor.submit(_send_mailgun_email_logged, to_email, subject, variables)
+    )
@@ -6,9 +6,9 @@ from django.shortcuts import get_object_or_404, redirect
 from django.http import JsonResponse, HttpResponseRedirect
 from django.contrib import messages
 from datetime import datetime
-from .models import PolicySection, Policy, PolicyApprovalRequest, ProcedureStep, Definition
+from .models import PolicySection, Policy, PolicyApprovalRequest, ProcedureStep
 from .forms import PolicyFeedbackForm, MajorChangeQuestionnaireForm
-from .utils import send_mailgun_email
+from .utils import send_mailgun_email_in_background
 from django.template.loader import render_to_string
 from django.db.models import ForeignKey, ManyToManyField
 
@@ -112,8 +112,8 @@ class PolicyFeedbackFormView(LoginRequiredMixin, FormView):
             "employee_email": employee_email,
         }
 
-        # Send confirmation email to the employee
-        send_mailgun_email(
+        # Send confirmation email to the employee without holding up the redirect
+        send_mailgun_email_in_background(
             to_email=employee_email,
             subject="Policy Feedback Received",
             variables=variables,
@@ -139,7 +139,6 @@ class MajorChangeQuestionnaireView(LoginRequiredMixin, FormView):
         policy = get_object_or_404(Policy, id=self.kwargs["policy_id"])
 
         unsaved_changes = self.request.session.get("unsaved_policy_changes", {})
-        print("Views", unsaved_changes)
 
         # Check if any major impacts are identified
         is_major_change = any([
@@ -207,22 +206,20 @@ class MajorChangeQuestionnaireView(LoginRequiredMixin, FormView):
                 # Update related policies
                 policy.related_policies.set(value)
             elif field == "procedure_steps":
-                # Clear existing procedure steps and add new ones
+                # Clear existing procedure steps and add new ones in a single insert,
+                # numbering steps in order as ProcedureStep.save would
                 policy.procedure_steps.all().delete()
-                for step in value:
-                    if not step.get("DELETE"):  # Skip deleted steps
-                        ProcedureStep.objects.create(
-                            policy=policy,
-                            step_number=step["step_number"],
-                            description=step["description"],
-                        )
+                steps = [step for step in value if not step.get("DELETE")]  # Skip deleted steps
+                ProcedureStep.objects.bulk_create([
+                    ProcedureStep(policy=policy, step_number=number, description=step["description"])
+                    for number, step in enumerate(steps, start=1)
+                ])
             elif field == "definitions":
-                # Clear existing definitions and associate new ones
+                # Clear existing definitions and associate new ones by id
                 policy.definitions.clear()
-                for definition in value:
-                    if not definition.get("DELETE"): # Skip deleted steps
-                        definition_instance = Definition.objects.get(id=definition["id"])
-                        policy.definitions.add(definition_instance)
+                policy.definitions.add(*[
+                    definition["id"] for definition in value if not definition.get("DELETE")  # Skip deleted definitions
+                ])
             else:
                 # Handle other fields, including ForeignKey and ManyToMany
                 field_obj = policy._meta.get_field(field)
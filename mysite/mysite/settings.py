@@ -124,6 +124,19 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+
+# Per-process memory cache for the handbook nav bar. Switch to a shared backend such as Redis or
+# Memcached when running several worker processes. Sessions stay on the default database engine,
+# a per-process cache would keep serving sessions flushed or changed by another worker
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 